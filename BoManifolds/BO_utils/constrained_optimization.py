@@ -215,6 +215,7 @@ class AnchorPointsGeneratorWithSpdConstraint:
     self.dim:
     self.min_eigenvalue:
     self.max_eigenvalue:
+    self.low_discrepancy:
 
     Methods
     -------
@@ -223,8 +224,9 @@ class AnchorPointsGeneratorWithSpdConstraint:
 
     Static methods
     --------------
+    halton_sequence(nb_samples, dim):
     """
-    def __init__(self, domain, dim, min_eigenvalue=1., max_eigenvalue=2.):
+    def __init__(self, domain, dim, min_eigenvalue=1., max_eigenvalue=2., low_discrepancy=False):
         """
         Initialization
 
@@ -237,11 +239,14 @@ class AnchorPointsGeneratorWithSpdConstraint:
         -------------------
         :param min_eigenvalue: minimum eigenvalue of the samples
         :param max_eigenvalue: maximum eigenvalue of the samples
+        :param low_discrepancy: if True, the logarithms of the eigenvalues are sampled with a randomly shifted Halton
+            sequence instead of sampling the eigenvalues uniformly at random
         """
         self.domain = domain
         self.dim = dim
         self.min_eigenvalue = min_eigenvalue
         self.max_eigenvalue = max_eigenvalue
+        self.low_discrepancy = low_discrepancy
 
     def generate_samples(self, nb_samples=1000):
         """
@@ -256,8 +261,15 @@ class AnchorPointsGeneratorWithSpdConstraint:
         :return: SPD samples
         """
         # Generate eigenvalues between min_eigenvalue and max_eigenvalue
-        d = self.min_eigenvalue * np.ones((nb_samples, self.dim)) \
-            + (self.max_eigenvalue - self.min_eigenvalue) * np.random.rand(nb_samples, self.dim)
+        if self.low_discrepancy:
+            # The Halton points are randomly shifted modulo 1, so that successive calls give different samples
+            halton_samples = np.mod(self.halton_sequence(nb_samples, self.dim) + np.random.rand(self.dim), 1.)
+            log_min_eigenvalue = np.log(self.min_eigenvalue)
+            log_max_eigenvalue = np.log(self.max_eigenvalue)
+            d = np.exp(log_min_eigenvalue + (log_max_eigenvalue - log_min_eigenvalue) * halton_samples)
+        else:
+            d = self.min_eigenvalue * np.ones((nb_samples, self.dim)) \
+                + (self.max_eigenvalue - self.min_eigenvalue) * np.random.rand(nb_samples, self.dim)
 
         # Generate an orthogonal matrix. Annoyingly qr decomp isn't
         # vectorized so need to use a for loop. Could be done using
@@ -265,14 +277,49 @@ class AnchorPointsGeneratorWithSpdConstraint:
         point_mat = np.zeros((nb_samples, self.dim, self.dim))
         points = []
         for n in range(nb_samples):
-            u, _ = np.linalg.qr(np.random.randn(self.dim, self.dim))
-            point_mat[n] = np.dot(u, np.dot(np.diag(d[n]), u.T))
+            q, _ = np.linalg.qr(np.random.randn(self.dim, self.dim))
+            point_mat[n] = np.dot(q, np.dot(np.diag(d[n]), q.T))
             points.append(symmetric_matrix_to_vector_mandel(point_mat[n]))
 
         points = np.array(points)
 
         return points
 
+    @staticmethod
+    def halton_sequence(nb_samples, dim):
+        """
+        Generate the first points of the Halton sequence in the unit hypercube. The coordinate d of the i-th point is
+        the radical inverse of i in the base given by the d-th prime number.
+
+        Parameters
+        ----------
+        :param nb_samples: number of samples
+        :param dim: dimension of the samples
+
+        Returns
+        -------
+        :return: nb_samples x dim array of samples in [0, 1)
+        """
+        # First dim prime numbers
+        primes = []
+        candidate = 2
+        while len(primes) < dim:
+            if all(candidate % p != 0 for p in primes):
+                primes.append(candidate)
+            candidate += 1
+
+        # The sequence starts at 1, as the point 0 is the origin in all dimensions
+        samples = np.zeros((nb_samples, dim))
+        for k, base in enumerate(primes):
+            indices = np.arange(1, nb_samples + 1)
+            factor = 1.
+            while np.any(indices > 0):
+                factor /= base
+                samples[:, k] += factor * (indices % base)
+                indices = indices // base
+
+        return samples
+
     def generate(self, objective, nb_anchor_points=5, nb_samples=1000):
         """
         Generate SPD anchor points. Samples are generated and the points with the best score are returned.
@@ -33,6 +33,7 @@ class ManifoldOptimizer(gpflowopt.optim.Optimizer):
     self.vector_to_matrix_transform_tf:
     self.linesearch:
     self.solver_type:
+    self.precon:
 
     Methods
     -------
@@ -44,7 +45,7 @@ class ManifoldOptimizer(gpflowopt.optim.Optimizer):
     def __init__(self, domain, manifold, manifold_dim=None, matrix_manifold_dim=None, matrix_to_vector_transform=None,
                  vector_to_matrix_transform=None, matrix_to_vector_transform_tf=None,
                  vector_to_matrix_transform_tf=None, solver_type='ConjugateGradient', linesearch_obj=None,
-                 logverbosity=1, **kwargs):
+                 logverbosity=1, precon=None, **kwargs):
         """
         Initialization
 
@@ -73,6 +74,8 @@ class ManifoldOptimizer(gpflowopt.optim.Optimizer):
         :param linesearch_obj: linesearch object
             Options are LineSearchAdaptive and LineSearchBackTracking
         :param logverbosity: characterise the output format (MUST be >=1)
+        :param precon: preconditioner precon(x, grad) applied to the Riemannian gradient by the conjugate gradient
+            solvers. None for no preconditioning.
         :param kwargs: parameters for the linesearch_obj and for the solver
         """
         super(ManifoldOptimizer, self).__init__(domain)
@@ -157,6 +160,7 @@ class ManifoldOptimizer(gpflowopt.optim.Optimizer):
 
         # Initialize solver
         self.solver_type = solver_type
+        self.precon = precon
 
         if 'mingradnorm' in kwargs:
             mingradnorm = kwargs['mingradnorm']
@@ -246,24 +250,38 @@ class ManifoldOptimizer(gpflowopt.optim.Optimizer):
         else:
             x_tf = tf.Variable(tf.zeros([self.matrix_manifold_dimension, self.matrix_manifold_dimension], dtype=tf.float64))
 
+        # The objective returns both the function value and the gradient. The last evaluation is kept, so that the cost
+        # and the gradient at the same point (as required by the solvers) are obtained with a single evaluation.
+        # Points are compared before their transformation to vectors, as the tensorflow and numpy transforms do not
+        # read the same off-diagonal elements and the points of the solvers are not exactly symmetric.
+        last_evaluation = {'x': None, 'objective': None}
+
+        def evaluate_objective(x_key, x):
+            if last_evaluation['x'] is None or not np.array_equal(last_evaluation['x'], x_key):
+                last_evaluation['x'] = x_key
+                last_evaluation['objective'] = objective(x)
+            return last_evaluation['objective']
+
         # Cost function for pymanopt
         def objective_fct(x):
+            x_key = np.ravel(np.array(x))
             if self.matrix_to_vector_transform_tf is not None:
                 # Reshape x from matrix to vector form to compute the objective function (tensorflow format)
                 x = self.matrix_to_vector_transform_tf(x, self.matrix_manifold_dimension)
-            return objective(x)[0]
+            return evaluate_objective(x_key, np.array(x))[0]
 
         # Transform the cost function to tensorflow function
         cost = tf.py_function(objective_fct, [x_tf], tf.float64)
 
         # Gradient function for pymanopt
         def objective_grad(x):
+            x_key = np.ravel(np.array(x))
             if self.matrix_to_vector_transform is not None:
                 # Reshape x from matrix to vector form to compute the gradient
                 x = self.matrix_to_vector_transform(x)
 
             # Compute the gradient
-            grad = np.array(objective(x)[1])[0]
+            grad = np.array(evaluate_objective(x_key, x)[1])[0]
 
             if self.vector_to_matrix_transform is not None:
                 # Reshape the gradient in matrix form for the optimization on the manifold
@@ -271,7 +289,8 @@ class ManifoldOptimizer(gpflowopt.optim.Optimizer):
             return grad
 
         # Define pymanopt problem
-        problem = pyman.Problem(manifold=self.manifold, cost=cost, egrad=objective_grad, arg=x_tf, verbosity=2)
+        problem = pyman.Problem(manifold=self.manifold, cost=cost, egrad=objective_grad, arg=x_tf, precon=self.precon,
+                                verbosity=2)
 
         # Optimize the parameters of the problem
         opt_x, opt_log = self.solver.solve(problem, x=initial)
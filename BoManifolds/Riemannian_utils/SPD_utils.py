@@ -101,6 +101,68 @@ def vector_to_symmetric_matrix_mandel(v):
     return M
 
 
+def vector_to_symmetric_matrix_mandel_batch(v):
+    """
+    Vectors to symmetric matrices using Mandel notation
+
+    Parameters
+    ----------
+    :param v: vectors                                   [N x nb_dim_vec]
+
+    Returns
+    -------
+    :return: symmetric matrices M                       [N x nb_dim x nb_dim]
+    """
+    n = v.shape[1]
+    N = int((-1.0 + (1.0+8.0*n)**0.5)/2.0)
+
+    M = np.zeros((v.shape[0], N, N))
+    M[:, range(N), range(N)] = v[:, 0:N]
+
+    id = np.cumsum(range(N, 0, -1))
+
+    for i in range(0, N-1):
+        rows = np.arange(N-i-1)
+        M[:, rows, rows+i+1] = v[:, id[i]:id[i+1]] / 2.0**0.5
+        M[:, rows+i+1, rows] = v[:, id[i]:id[i+1]] / 2.0**0.5
+
+    return M
+
+
+def symmetric_matrix_function(M, fct):
+    """
+    Apply a scalar function to a symmetric matrix through its eigendecomposition
+
+    Parameters
+    ----------
+    :param M: symmetric matrix, or stack of symmetric matrices                    [d x d] or [N x d x d]
+    :param fct: function applied elementwise on the eigenvalues (e.g. np.log, np.exp, np.sqrt)
+
+    Returns
+    -------
+    :return: symmetric matrix V fct(D) V' with M = V D V'                          [d x d] or [N x d x d]
+    """
+    if M.shape[-2:] == (2, 2):
+        # Closed-form eigenvalues l1,2 = t +- r of 2x2 symmetric matrices, which avoids the LAPACK call.
+        # With the spectral projectors, fct(M) = (fct(l1) + fct(l2)) / 2 I + (fct(l1) - fct(l2)) / (2r) (M - t I).
+        half_diff = 0.5 * (M[..., 0, 0] - M[..., 1, 1])
+        t = 0.5 * (M[..., 0, 0] + M[..., 1, 1])
+        r = np.hypot(half_diff, M[..., 0, 1])
+        f1 = fct(t + r)
+        f2 = fct(t - r)
+        f_mean = 0.5 * (f1 + f2)
+        f_slope = np.divide(0.5 * (f1 - f2), r, out=np.zeros(np.shape(r)), where=r > 0.)
+
+        F = np.empty(M.shape)
+        F[..., 0, 0] = f_mean + f_slope * half_diff
+        F[..., 1, 1] = f_mean - f_slope * half_diff
+        F[..., 0, 1] = F[..., 1, 0] = f_slope * M[..., 0, 1]
+        return F
+
+    D, V = np.linalg.eigh(M)
+    return np.matmul(V * fct(D)[..., None, :], np.swapaxes(V, -1, -2))
+
+
 def expmap(U, S):
     """
     Exponential map
@@ -112,10 +174,11 @@ def expmap(U, S):
 
     Returns
     -------
-    :return: SPD matrix computed as Expmap_S(U)
+    :return: SPD matrix computed as Expmap_S(U) = S^0.5 expm(S^-0.5 U S^-0.5) S^0.5
     """
-    D, V = np.linalg.eig(np.linalg.solve(S, U))
-    X = S.dot(V.dot(np.diag(np.exp(D))).dot(np.linalg.inv(V)))
+    S_sqrt = symmetric_matrix_function(S, np.sqrt)
+    S_inv_sqrt = np.linalg.inv(S_sqrt)
+    X = np.dot(S_sqrt, np.dot(symmetric_matrix_function(np.dot(S_inv_sqrt, np.dot(U, S_inv_sqrt)), np.exp), S_sqrt))
 
     return X
 
@@ -131,10 +194,11 @@ def logmap(X, S):
 
     Returns
     -------
-    :return: symmetric matrix computed as Logmap_S(X)
+    :return: symmetric matrix computed as Logmap_S(X) = S^0.5 logm(S^-0.5 X S^-0.5) S^0.5
     """
-    D, V = np.linalg.eig(np.linalg.solve(S, X))
-    U = S.dot(V.dot(np.diag(np.log(D))).dot(np.linalg.inv(V)))
+    S_sqrt = symmetric_matrix_function(S, np.sqrt)
+    S_inv_sqrt = np.linalg.inv(S_sqrt)
+    U = np.dot(S_sqrt, np.dot(symmetric_matrix_function(np.dot(S_inv_sqrt, np.dot(X, S_inv_sqrt)), np.log), S_sqrt))
 
     return U
 
@@ -183,18 +247,16 @@ def affine_invariant_distance(S1, S2):
 
     Parameters
     ----------
-    :param S1: SPD matrix
-    :param S2: SPD matrix
+    :param S1: SPD matrix, or stack of SPD matrices             [d x d] or [N x d x d]
+    :param S2: SPD matrix, or stack of SPD matrices             [d x d] or [N x d x d]
 
     Returns
     -------
-    :return: affine invariant distance between S1 and S2
+    :return: affine invariant distance ||logm(S1^-0.5 S2 S1^-0.5)||_F between S1 and S2      scalar or [N]
     """
-    # S1_pow = sc_la.fractional_matrix_power(S1, -0.5)
-    # return np.linalg.norm(sc_la.logm(np.dot(np.dot(S1_pow, S2), S1_pow)), 'fro')
-
-    eigv, _ = np.linalg.eig(np.dot(np.linalg.inv(S1), S2))
-    return np.sqrt(np.sum(np.log(eigv)*np.log(eigv)))
+    S1_inv_sqrt = symmetric_matrix_function(S1, lambda d: 1. / np.sqrt(d))
+    log_m = symmetric_matrix_function(np.matmul(S1_inv_sqrt, np.matmul(S2, S1_inv_sqrt)), np.log)
+    return np.linalg.norm(log_m, axis=(-2, -1))
 
 
 def parallel_transport_operator(S1, S2):
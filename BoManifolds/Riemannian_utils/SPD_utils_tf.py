@@ -118,16 +118,19 @@ def affine_invariant_distance_tf(S1, S2, full_dist_mat=False):
         if np.size(S2.get_shape()) == 2:
             S2 = tf.expand_dims(S2, 0)
 
-        S1 = tf.expand_dims(S1, 1)
+        # S1^-1/2 is computed once for each matrix of S1, before being repeated for each matrix of S2
+        S1_invhalf = tf.linalg.sqrtm(tf.matrix_inverse(S1))
+
+        S1_invhalf = tf.expand_dims(S1_invhalf, 1)
         S2 = tf.expand_dims(S2, 0)
 
         # Repeat x and y data along 1- and 0- dimensions to have ndata_S1 x ndata_S2 x dim x dim arrays
-        S1 = tf.tile(S1, [1, tf.shape(S2)[1], 1, 1])
-        S2 = tf.tile(S2, [tf.shape(S1)[0], 1, 1, 1])
+        S1_invhalf = tf.tile(S1_invhalf, [1, tf.shape(S2)[1], 1, 1])
+        S2 = tf.tile(S2, [tf.shape(S1_invhalf)[0], 1, 1, 1])
+    else:
+        S1_invhalf = tf.linalg.sqrtm(tf.matrix_inverse(S1))
 
     # Compute the distance between each pair of matrices
-    S1_invhalf = tf.linalg.sqrtm(tf.matrix_inverse(S1))
-
     mult_tens = tf.matmul(tf.matmul(S1_invhalf, S2), S1_invhalf)
 
     # eigval, _ = tf.self_adjoint_eig(mult_tens)  # does not give eigenvalues, maybe due to need of self_adjoint matrices
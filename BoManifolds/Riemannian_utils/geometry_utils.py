@@ -1,3 +1,4 @@
+import math
 import numpy as np
 
 '''
@@ -7,22 +8,108 @@ Contact: noemie.jaquier@idiap.ch, leonel.rozo@de.bosch.com
 '''
 
 
+# Rotation matrices already computed for single axes and angles, indexed by (ax, angle)
+_rotation_matrix_cache = {}
+_rotation_matrix_cache_max_size = 4096
+
+
 def rotation_matrix_from_axis_angle(ax, angle):
     """
     Gets rotation matrix from axis angle representation using Rodriguez formula.
     Based on the function of riepybdlib (https://gitlab.martijnzeestraten.nl/martijn/riepybdlib)
+    Several rotations can be computed at once by giving arrays of axes and angles.
+    Rotation matrices of single axes and angles are cached, so that repeated calls return a copy of the stored matrix.
+
+    Parameters
+    ----------
+    :param ax: unit axis defining the axis of rotation                  [3] or [N x 3]
+    :param angle: angle of rotation                                     scalar or [N]
+
+    Returns
+    -------
+    :return: R(ax, angle) = I + sin(angle) x ax + (1 - cos(angle) ) x ax^2 with x the cross product.
+        [3 x 3] or [N x 3 x 3]
+    """
+    if np.isscalar(angle) and np.ndim(ax) == 1:
+        key = (float(ax[0]), float(ax[1]), float(ax[2]), float(angle))
+        if key not in _rotation_matrix_cache:
+            if len(_rotation_matrix_cache) >= _rotation_matrix_cache_max_size:
+                _rotation_matrix_cache.clear()
+            _rotation_matrix_cache[key] = rodrigues_rotation_matrix(ax, angle)
+        return _rotation_matrix_cache[key].copy()
+
+    return rodrigues_rotation_matrix(np.asarray(ax), np.asarray(angle))
+
+
+def rodrigues_rotation_matrix(ax, angle, out=None):
+    """
+    Computes the rotation matrix of the Rodrigues formula in closed form, without cache.
 
     Parameters
     ----------
-    :param ax: unit axis defining the axis of rotation
-    :param angle: angle of rotation
+    :param ax: unit axis defining the axis of rotation                  [3] or [N x 3]
+    :param angle: angle of rotation                                     scalar or [N]
+
+    Optional parameters
+    -------------------
+    :param out: array in which the rotation matrix is written, so that no array is allocated by the call
+        [3 x 3] or [N x 3 x 3]
 
     Returns
     -------
     :return: R(ax, angle) = I + sin(angle) x ax + (1 - cos(angle) ) x ax^2 with x the cross product.
+        [3 x 3] or [N x 3 x 3]
     """
-    utilde = vector_to_skew_matrix(ax)
-    return np.eye(3) + np.sin(angle)*utilde + (1 - np.cos(angle))*utilde.dot(utilde)
+    # Closed-form expansion of the formula, written entrywise to avoid the matrix products on 3x3 matrices.
+    # Since ax^2 = ax ax' - |ax|^2 I, the diagonal is written as 1 - (1 - cos(angle)) (|ax|^2 - ax_i^2).
+    if np.ndim(ax) == 1 and np.isscalar(angle):
+        # Single rotation: computed with Python floats, as numpy functions are slow on single values
+        x, y, z = float(ax[0]), float(ax[1]), float(ax[2])
+        c = math.cos(angle)
+        s = math.sin(angle)
+        C = 1. - c
+
+        if out is None:
+            R = np.empty((3, 3))
+        elif out.shape != (3, 3):
+            raise ValueError('out must be a 3x3 array for a single rotation, got shape %s.' % (out.shape,))
+        else:
+            R = out
+
+        R[0, 0] = 1. - (y*y + z*z)*C
+        R[0, 1] = x*y*C - z*s
+        R[0, 2] = x*z*C + y*s
+        R[1, 0] = x*y*C + z*s
+        R[1, 1] = 1. - (x*x + z*z)*C
+        R[1, 2] = y*z*C - x*s
+        R[2, 0] = x*z*C - y*s
+        R[2, 1] = y*z*C + x*s
+        R[2, 2] = 1. - (x*x + y*y)*C
+        return R
+
+    x, y, z = ax[..., 0], ax[..., 1], ax[..., 2]
+    shape = np.broadcast(x, angle).shape + (3, 3)
+    if out is None:
+        R = np.empty(shape)
+    elif out.shape != shape:
+        raise ValueError('out must have shape %s, got shape %s.' % (shape, out.shape))
+    else:
+        R = out
+
+    c = np.cos(angle)
+    s = np.sin(angle)
+    C = 1. - c
+
+    R[..., 0, 0] = 1. - (y*y + z*z)*C
+    R[..., 0, 1] = x*y*C - z*s
+    R[..., 0, 2] = x*z*C + y*s
+    R[..., 1, 0] = x*y*C + z*s
+    R[..., 1, 1] = 1. - (x*x + z*z)*C
+    R[..., 1, 2] = y*z*C - x*s
+    R[..., 2, 0] = x*z*C - y*s
+    R[..., 2, 1] = y*z*C + x*s
+    R[..., 2, 2] = 1. - (x*x + y*y)*C
+    return R
 
 
 def vector_to_skew_matrix(q):
@@ -37,4 +124,12 @@ def vector_to_skew_matrix(q):
     -------
     :return: corresponding skew-symmetric matrix
     """
-    return np.array([[0, -q[2], q[1]], [q[2], 0, -q[0]], [-q[1], q[0], 0]])
\ No newline at end of file
+    # Same dtype as the array [[0, -q[2], q[1]], ...], where the literal zeros are promoted as int64 values
+    S = np.zeros((3, 3), dtype=np.result_type(np.asarray(q).dtype, np.int64))
+    S[0, 1] = -q[2]
+    S[0, 2] = q[1]
+    S[1, 0] = q[2]
+    S[1, 2] = -q[0]
+    S[2, 0] = -q[1]
+    S[2, 1] = q[0]
+    return S
@@ -581,8 +581,54 @@ def bo_plot_gp_sphere_planar(fig, model, var_fact=2., xs=None, ys=None, opt_x=No
     return ax1, ax2
 
 
+# SPD cone meshes already computed, indexed by (r_cone, n_elems, n_elems_h)
+_spd_cone_mesh_cache = {}
+
+
+def spd_cone_mesh(r_cone, n_elems=100, n_elems_h=10):
+    """
+    Compute the points of slices of the SPD cone used to plot functions in the cone.
+    The meshes are cached, so that plots with the same parameters reuse the same points.
+
+    Parameters
+    ----------
+    :param r_cone: cone radius
+
+    Optional parameters
+    -------------------
+    :param n_elems: number of elements in a slice of the cone
+    :param n_elems_h: number of slices of the cone
+
+    Returns
+    -------
+    :return: x, y and z coordinates of the points of the slices (read-only)    [n_elems_h x n_elems x n_elems] each
+    """
+    key = (float(r_cone), n_elems, n_elems_h)
+    if key not in _spd_cone_mesh_cache:
+        phi = np.linspace(0, 2 * np.pi, n_elems)
+
+        # Matrix for rotation of 45° of the cone
+        dir = np.cross(np.array([1, 0, 0]), np.array([1., 1., 0.]))
+        R = rotation_matrix_from_axis_angle(dir, np.pi / 4.)
+
+        # Points on planes cutting the cone, with radius r in [0, h-0.01] for the slice at height h
+        h = np.linspace(0.01, r_cone, n_elems_h)
+        r = (h[:, None] - 0.01) * np.linspace(0., 1., n_elems)[None]
+        xyz = (h[:, None, None] * np.ones((1, n_elems, n_elems)),
+               r[:, :, None] * np.sin(phi)[None, None],
+               r[:, :, None] / np.sqrt(2) * np.cos(phi)[None, None])
+
+        # Rotation
+        mesh = tuple(R[d, 0] * xyz[0] + R[d, 1] * xyz[1] + R[d, 2] * xyz[2] for d in range(3))
+        for coordinates in mesh:
+            coordinates.setflags(write=False)
+        _spd_cone_mesh_cache[key] = mesh
+
+    return _spd_cone_mesh_cache[key]
+
+
 def bo_plot_function_spd(ax, function, r_cone, true_opt_x=None, true_opt_y=None, chol=False, max_colors=None,
-                         alpha=0.3, elev=10, azim=-20, n_elems=100, n_elems_h=10):
+                         alpha=0.3, elev=10, azim=-20, n_elems=100, n_elems_h=10, vectorized=False):
     """
     Plot a function in the SPD cone
 
@@ -603,6 +649,8 @@ def bo_plot_function_spd(ax, function, r_cone, true_opt_x=None, true_opt_y=None,
     :param azim: axis azimut
     :param n_elems: number of elements to plot in a slice of the cone
     :param n_elems_h: number of slices of the cone to plot
+    :param vectorized: if True, the function is evaluated at once for all the points of a slice of the cone
+        (inputs [n x 3], outputs [n x 1]). Not used if chol is True.
 
     Returns
     -------
@@ -629,44 +677,27 @@ def bo_plot_function_spd(ax, function, r_cone, true_opt_x=None, true_opt_y=None,
     # Plot SPD cone
     plot_spd_cone(ax, r=r_cone, lim_fact=0.8)
 
-    # Values of test function for points on the manifold
-    phi = np.linspace(0, 2 * np.pi, n_elems)
-
-    # Matrix for rotation of 45° of the cone
-    dir = np.cross(np.array([1, 0, 0]), np.array([1., 1., 0.]))
-    R = rotation_matrix_from_axis_angle(dir, np.pi / 4.)
-
     # Points of the cone
-    h = np.linspace(0.01, r_cone, n_elems_h)
-    x_cone = np.zeros((n_elems_h, n_elems, n_elems))
-    y_cone = np.zeros((n_elems_h, n_elems, n_elems))
-    z_cone = np.zeros((n_elems_h, n_elems, n_elems))
+    x_cone, y_cone, z_cone = spd_cone_mesh(r_cone, n_elems, n_elems_h)
+
+    # Values of test function for points on the manifold
     colors = np.zeros((n_elems_h, n_elems, n_elems))
     for k in range(n_elems_h):
-        r = np.linspace(0, h[k] - 0.01, n_elems)
-        for i in range(n_elems):
-            # Points on a plane cutting the cone
-            xyz = np.vstack((h[k] * np.ones(n_elems), r[i] * np.sin(phi), r[i] / np.sqrt(2) * np.cos(phi)))
-
-            # Rotation
-            xyz = R.dot(xyz)
-
-            # Coordinates
-            x_cone[k, i] = xyz[0]
-            y_cone[k, i] = xyz[1]
-            z_cone[k, i] = xyz[2]
-
         # Compute the function values at given points
-        for i in range(n_elems):
-            for j in range(n_elems):
-                if not chol:
-                    data_tmp = np.array([[x_cone[k, i, j], y_cone[k, i, j], z_cone[k, i, j] * np.sqrt(2)]])
-                    colors[k, i, j] = function(data_tmp)
-                else:
-                    indices = np.tril_indices(2)
-                    data_tmp = np.array([[x_cone[k, i, j], z_cone[k, i, j]], [z_cone[k, i, j], y_cone[k, i, j]]])
-                    data_chol_tmp = np.linalg.cholesky(data_tmp)
-                    colors[k, i, j] = function(data_chol_tmp[indices])
+        if vectorized and not chol:
+            data_tmp = np.vstack((x_cone[k].ravel(), y_cone[k].ravel(), z_cone[k].ravel() * np.sqrt(2))).T
+            colors[k] = function(data_tmp).reshape(n_elems, n_elems)
+        else:
+            for i in range(n_elems):
+                for j in range(n_elems):
+                    if not chol:
+                        data_tmp = np.array([[x_cone[k, i, j], y_cone[k, i, j], z_cone[k, i, j] * np.sqrt(2)]])
+                        colors[k, i, j] = function(data_tmp)
+                    else:
+                        indices = np.tril_indices(2)
+                        data_tmp = np.array([[x_cone[k, i, j], z_cone[k, i, j]], [z_cone[k, i, j], y_cone[k, i, j]]])
+                        data_chol_tmp = np.linalg.cholesky(data_tmp)
+                        colors[k, i, j] = function(data_chol_tmp[indices])
 
     # Rescale the colors
     if true_opt_y is not None:
@@ -740,33 +771,12 @@ def bo_plot_acquisition_spd(ax, acq_fct, r_cone, xs=None, ys=None, opt_x=None, t
     # Plot SPD cone
     plot_spd_cone(ax, r=r_cone, lim_fact=0.8)
 
-    # Values of test function for points on the manifold
-    phi = np.linspace(0, 2 * np.pi, n_elems)
-
-    # Matrix for rotation of 45° of the cone
-    dir = np.cross(np.array([1, 0, 0]), np.array([1., 1., 0.]))
-    R = rotation_matrix_from_axis_angle(dir, np.pi / 4.)
-
     # Points of the cone
-    h = np.linspace(0.01, r_cone, n_elems_h)
-    x_cone = np.zeros((n_elems_h, n_elems, n_elems))
-    y_cone = np.zeros((n_elems_h, n_elems, n_elems))
-    z_cone = np.zeros((n_elems_h, n_elems, n_elems))
+    x_cone, y_cone, z_cone = spd_cone_mesh(r_cone, n_elems, n_elems_h)
+
+    # Values of test function for points on the manifold
     colors = np.zeros((n_elems_h, n_elems, n_elems))
     for k in range(n_elems_h):
-        r = np.linspace(0, h[k] - 0.01, n_elems)
-        for i in range(n_elems):
-            # Points on a plane cutting the cone
-            xyz = np.vstack((h[k] * np.ones(n_elems), r[i] * np.sin(phi), r[i] / np.sqrt(2) * np.cos(phi)))
-
-            # Rotation
-            xyz = R.dot(xyz)
-
-            # Coordinates
-            x_cone[k, i] = xyz[0]
-            y_cone[k, i] = xyz[1]
-            z_cone[k, i] = xyz[2]
-
         for i in range(n_elems):
             for j in range(n_elems):
                 if not chol:
@@ -860,35 +870,13 @@ def bo_plot_gp_spd(ax, model, r_cone, xs=None, ys=None, opt_x=None, true_opt_x=N
     # Plot SPD cone
     plot_spd_cone(ax, r=r_cone, lim_fact=0.8)
 
-    # Value of test function for points on the manifold
-    # Values of test function for points on the manifold
-    phi = np.linspace(0, 2 * np.pi, n_elems)
-
-    # Matrix for rotation of 45° of the cone
-    dir = np.cross(np.array([1, 0, 0]), np.array([1., 1., 0.]))
-    R = rotation_matrix_from_axis_angle(dir, np.pi / 4.)
-
     # Points of the cone
-    h = np.linspace(0.01, r_cone, n_elems_h)
-    x_cone = np.zeros((n_elems_h, n_elems, n_elems))
-    y_cone = np.zeros((n_elems_h, n_elems, n_elems))
-    z_cone = np.zeros((n_elems_h, n_elems, n_elems))
+    x_cone, y_cone, z_cone = spd_cone_mesh(r_cone, n_elems, n_elems_h)
+
+    # Values of test function for points on the manifold
     colors = np.zeros((n_elems_h, n_elems, n_elems))
     var = np.zeros((n_elems_h, n_elems, n_elems))
     for k in range(n_elems_h):
-        r = np.linspace(0, h[k] - 0.01, n_elems)
-        for i in range(n_elems):
-            # Points on a plane cutting the cone
-            xyz = np.vstack((h[k] * np.ones(n_elems), r[i] * np.sin(phi), r[i] / np.sqrt(2) * np.cos(phi)))
-
-            # Rotation
-            xyz = R.dot(xyz)
-
-            # Coordinates
-            x_cone[k, i] = xyz[0]
-            y_cone[k, i] = xyz[1]
-            z_cone[k, i] = xyz[2]
-
         for i in range(n_elems):
             for j in range(n_elems):
                 if not chol:
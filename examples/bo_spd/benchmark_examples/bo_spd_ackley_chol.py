@@ -279,9 +279,7 @@ if __name__ == "__main__":
     for n in range(nb_eval - 1):
         distances[n] = np.linalg.norm(x_eval_chol[n + 1, :] - x_eval_chol[n, :])
     # Compute best evaluation for each iteration
-    y_best = np.ones(nb_eval)
-    for i in range(nb_eval):
-        y_best[i] = y_eval[:(i + 1)].min()
+    y_best = np.minimum.accumulate(y_eval.ravel())
 
     #  Plot distances between consecutive x's
     plt.figure(figsize=(10, 5))
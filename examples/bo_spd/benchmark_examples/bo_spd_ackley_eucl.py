@@ -236,9 +236,7 @@ if __name__ == "__main__":
     for n in range(neval - 1):
         distances[n] = np.linalg.norm(x_eval[n + 1, :] - x_eval[n, :])
     # Compute best evaluation for each iteration
-    y_best = np.ones(neval)
-    for i in range(neval):
-        y_best[i] = y_eval[:(i + 1)].min()
+    y_best = np.minimum.accumulate(y_eval.ravel())
 
     #  Plot distances between consecutive x's
     plt.figure(figsize=(10, 5))
@@ -9,7 +9,8 @@ import matplotlib.pylab as pl
 from mpl_toolkits.mplot3d import Axes3D
 
 from BoManifolds.Riemannian_utils.SPD_utils import symmetric_matrix_to_vector_mandel, \
-    vector_to_symmetric_matrix_mandel, in_domain, project_to_domain
+    vector_to_symmetric_matrix_mandel, vector_to_symmetric_matrix_mandel_batch, in_domain, project_to_domain, \
+    symmetric_matrix_function, expmap, logmap
 from BoManifolds.Riemannian_utils.SPD_utils_tf import symmetric_matrix_to_vector_tf
 
 from BoManifolds.kernel_utils.kernels_spd_tf import SpdAffineInvariantGaussianKernel
@@ -49,8 +50,8 @@ The current optimum value of the function is printed at each BO iteration and th
 (on the sphere) is printed at the end of the queries. 
 The following graphs are produced by this example:
 - the convergence graph shows the distance between two consecutive iterations and the best function value found by the 
-    BO at each iteration. Note that the randomly generated initial data are not displayed, so that the iterations number 
-    starts at the number of initial data + 1.
+    BO at each iteration. The Log-Euclidean distance is used for this graph. Note that the randomly generated initial 
+    data are not displayed, so that the iterations number starts at the number of initial data + 1.
 The following graphs are produced by this example if 'display_figures' is 'True':
 - the true function graph is displayed on S2_++;
 - the acquisition function at the end of the optimization is displayed on S2_++;
@@ -65,6 +66,28 @@ License: MIT
 Contact: noemie.jaquier@idiap.ch, leonel.rozo@de.bosch.com
 """
 
+
+def _ackley_from_tangent(x00, x11, x10):
+    """
+    Ackley function of the three independent components of symmetric matrices of the tangent space.
+
+    Parameters
+    ----------
+    :param x00: first diagonal elements                 [N]
+    :param x11: second diagonal elements                [N]
+    :param x10: off-diagonal elements                   [N]
+
+    Returns
+    -------
+    :return: values of the Ackley function              [N]
+    """
+    a = 20
+    b = 0.2
+    c = 2 * np.pi
+    return -a * np.exp(-b * np.sqrt((x00 ** 2 + x11 ** 2 + x10 ** 2) / 3.)) \
+        - np.exp((np.cos(c * x00) + np.cos(c * x11) + np.cos(c * x10)) / 3.) + a + np.exp(1.)
+
+
 if __name__ == "__main__":
     np.random.seed(1234)
 
@@ -93,36 +116,43 @@ if __name__ == "__main__":
     spd_manifold.in_domain = in_domain
     spd_manifold.project_to_domain = project_to_domain
 
+    # Use the exponential and logarithm maps based on the symmetric eigendecomposition
+    spd_manifold.exp = lambda x, u: expmap(u, x)
+    spd_manifold.log = lambda x, y: logmap(y, x)
+
     # Bounding eigenvalues
     min_eigenvalue = 0.001
     max_eigenvalue = 5.
 
     # Function to optimize
     base = np.array([[2.5, -0.7], [-0.7, 2.3]])
+    # Square root and inverse square root of the base, computed once for all the logarithm maps
+    base_sqrt = symmetric_matrix_function(base, np.sqrt)
+    base_inv_sqrt = np.linalg.inv(base_sqrt)
 
-    # Define the function to optimize with BO
-    # Must output a numpy [1,1] shaped array
-    # Minus likelihood of covariance sigma for the distribution of data_test_fct (assumed centered)
-    def test_function(x):
-        x = vector_to_symmetric_matrix_mandel(x[0])
-
-        x_proj = spd_manifold.log(base, x)
+    # Test function for SPD matrices given as a [N,dim,dim] array, outputs a numpy [N,1] shaped array
+    def test_function_from_matrix(x):
+        # Logarithm map log_base(x) = base^0.5 logm(base^-0.5 x base^-0.5) base^0.5
+        log_m = symmetric_matrix_function(np.matmul(base_inv_sqrt, np.matmul(x, base_inv_sqrt)), np.log)
+        x_proj = np.matmul(base_sqrt, np.matmul(log_m, base_sqrt))
 
         # Ackley function
-        a = 20
-        b = 0.2
-        c = 2 * np.pi
-        y = -a * np.exp(-b * np.sqrt((x_proj[0, 0] ** 2 + x_proj[1, 1] ** 2 + x_proj[1, 0] ** 2) / 3.)) \
-            - np.exp((np.cos(c * x_proj[0, 0]) + np.cos(c * x_proj[1, 1]) + np.cos(c * x_proj[1, 0])) / 3.) \
-            + a + np.exp(1.)
+        y = _ackley_from_tangent(x_proj[:, 0, 0], x_proj[:, 1, 1], x_proj[:, 1, 0])
 
-        return y[None, None]
+        return y[:, None]
+
+    # Define the function to optimize with BO
+    # Must output a numpy [N,1] shaped array for N inputs given as a [N,dim_vec] array
+    # Minus likelihood of covariance sigma for the distribution of data_test_fct (assumed centered)
+    def test_function(x):
+        return test_function_from_matrix(vector_to_symmetric_matrix_mandel_batch(x))
 
     # Optimal parameter
     true_sigma = base
+    true_sigma_vec = symmetric_matrix_to_vector_mandel(true_sigma)[None]
 
     # Optimal function value
-    true_opt_val = test_function(symmetric_matrix_to_vector_mandel(true_sigma)[None])[0]
+    true_opt_val = test_function_from_matrix(true_sigma[None])[0]
 
     if display_figures:
         # Plot test function with inputs in the SPD manifold
@@ -131,7 +161,8 @@ if __name__ == "__main__":
         fig = plt.figure(figsize=(10, 10))
         ax = Axes3D(fig)
         max_colors = bo_plot_function_spd(ax, test_function, r_cone=r_cone, true_opt_x=true_sigma,
-                                          true_opt_y=true_opt_val, alpha=0.25, n_elems=100, n_elems_h=10)
+                                          true_opt_y=true_opt_val, alpha=0.25, n_elems=100, n_elems_h=10,
+                                          vectorized=True)
         ax.set_title('True function', fontsize=50)
         plt.show()
 
@@ -150,9 +181,7 @@ if __name__ == "__main__":
     # Generate random data in the SPD cone
     nb_data_init = 5
     x_init_vec = spd_random_generator.generate_samples(nb_samples=nb_data_init)
-    y_init = np.zeros((nb_data_init, 1))
-    for n in range(nb_data_init):
-        y_init[n] = test_function(x_init_vec[n][None])
+    y_init = test_function(x_init_vec)
 
     # Create gpflow model
     # As the kernel take vectors as inputs, we give the vector dimension
@@ -187,13 +216,17 @@ if __name__ == "__main__":
     Bopt = bo_optimizer.optimize(test_function, n_iter=nb_iter_bo)
     print(Bopt)
 
+    # Evaluated points, also stored as SPD matrices [nb_eval x dim x dim] for the plots and distances
+    x_eval = bo_optimizer.acquisition.data[0]
+    y_eval = bo_optimizer.acquisition.data[1]
+    x_eval_mat = vector_to_symmetric_matrix_mandel_batch(x_eval)
+
     if display_figures:
         # Plot the acquisition function
         fig = plt.figure(figsize=(10, 10))
         ax = Axes3D(fig)
         bo_plot_acquisition_spd(ax, acq_fct, r_cone=r_cone, xs=bo_optimizer.acquisition.data[0], opt_x=Bopt.x,
-                                true_opt_x=symmetric_matrix_to_vector_mandel(true_sigma)[None], n_elems=20,
-                                n_elems_h=10)
+                                true_opt_x=true_sigma_vec, n_elems=20, n_elems_h=10)
         ax.set_title('Acquisition function', fontsize=50)
         plt.show()
 
@@ -201,7 +234,7 @@ if __name__ == "__main__":
         fig = plt.figure(figsize=(10, 10))
         ax = Axes3D(fig)
         bo_plot_gp_spd(ax, model, r_cone=r_cone, xs=bo_optimizer.acquisition.data[0], opt_x=Bopt.x,
-                       true_opt_x=symmetric_matrix_to_vector_mandel(true_sigma)[None], true_opt_y=true_opt_val,
+                       true_opt_x=true_sigma_vec, true_opt_y=true_opt_val,
                        max_colors=25., n_elems=20, n_elems_h=10)
         ax.set_title('GP mean', fontsize=50)
         plt.show()
@@ -226,11 +259,8 @@ if __name__ == "__main__":
         # Plot SPD cone
         plot_spd_cone(ax, r=r_cone, lim_fact=0.8)
         # Plot evaluated points
-        x_eval = bo_optimizer.acquisition.data[0]
-        y_eval = bo_optimizer.acquisition.data[1]
-        for n in range(x_eval.shape[0]):
-            ax.scatter(x_eval[n, 0], x_eval[n, 1], x_eval[n, 2] / np.sqrt(2),
-                       c=pl.cm.inferno(1. - (y_eval[n] - true_opt_val) / max_colors))
+        ax.scatter(x_eval_mat[:, 0, 0], x_eval_mat[:, 1, 1], x_eval_mat[:, 0, 1],
+                   c=pl.cm.inferno(1. - (y_eval.ravel() - true_opt_val) / max_colors))
         # Plot true minimum
         ax.scatter(true_sigma[0, 0], true_sigma[1, 1], true_sigma[0, 1], s=40, c='g', marker='P')
         # Plot BO minimum
@@ -240,15 +270,12 @@ if __name__ == "__main__":
 
     # Convergence plots
     # Compute distances between consecutive x's
+    # The Log-Euclidean distance ||logm(x[n+1]) - logm(x[n])||_F is used, so that each logarithm is computed once
     nb_eval = x_eval.shape[0]
-    distances = np.zeros(nb_eval - 1)
-    for n in range(nb_eval - 1):
-        distances[n] = spd_manifold.dist(vector_to_symmetric_matrix_mandel(x_eval[n + 1, :]),
-                                         vector_to_symmetric_matrix_mandel(x_eval[n, :]))
+    log_x_eval = symmetric_matrix_function(x_eval_mat, np.log)
+    distances = np.linalg.norm(log_x_eval[1:] - log_x_eval[:-1], axis=(-2, -1))
     # Compute best evaluation for each iteration
-    y_best = np.ones(nb_eval)
-    for i in range(nb_eval):
-        y_best[i] = y_eval[:(i + 1)].min()
+    y_best = np.minimum.accumulate(y_eval.ravel())
 
     #  Plot distances between consecutive x's
     plt.figure(figsize=(10, 5))
@@ -222,9 +222,7 @@ if __name__ == "__main__":
     for n in range(neval-1):
         distances[n] = np.linalg.norm(x_eval[n + 1, :] - x_eval[n, :])
     # Compute best evaluation for each iteration
-    Y_best = np.ones(neval)
-    for i in range(neval):
-        Y_best[i] = y_eval[:(i + 1)].min()
+    Y_best = np.minimum.accumulate(y_eval.ravel())
 
     #  Plot distances between consecutive x's
     plt.figure(figsize=(10, 5))